@@ -0,0 +1,14 @@
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from core.venv_manager import VenvManager
+
+class VenvCreateThread(QThread):
+    finished_signal = pyqtSignal(bool)
+
+    def __init__(self, project_path, parent=None):
+        super().__init__(parent)
+        self.project_path = project_path
+
+    def run(self):
+        venv_manager = VenvManager(str(self.project_path))
+        self.finished_signal.emit(venv_manager.create_venv())
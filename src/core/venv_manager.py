@@ -1,4 +1,5 @@
 import os
+import shutil
 import subprocess
 import pathlib
 import venv
@@ -11,11 +12,15 @@ class VenvManager():
         return os.path.exists(os.path.join(self.project_path, ".venv"))
 
     def create_venv(self):
+        venv_dir = os.path.join(self.project_path, ".venv")
         try:
-            venv_dir = os.path.join(self.project_path, ".venv")
             venv.create(venv_dir, with_pip=True)
             return True
-        except Exception as e: 
+        except BaseException as e:
+            # venv_exists only checks the folder, a half-built one would never be rebuilt
+            shutil.rmtree(venv_dir, ignore_errors=True)
+            if not isinstance(e, Exception):
+                raise
             print(f".venv creation fail: {e}!")
             return False
 
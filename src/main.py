@@ -2,6 +2,7 @@ import sys
 import shutil
 from pathlib import Path
 import json
+import logging
 import os
 
 from PyQt6.QtCore import Qt, QTimer, QByteArray
@@ -20,6 +21,7 @@ from utils.layout_manager import LayoutManager
 from core.node_registry import NodeRegistry
 from core.venv_manager import VenvManager
 from core.package_installer import PackageInstallThread
+from core.venv_creator import VenvCreateThread
 from core.executor import WorkflowExecutor
 
 class MainWindow(QMainWindow):
@@ -40,6 +42,7 @@ class MainWindow(QMainWindow):
         self.node_registry = NodeRegistry()
 
         self.venv_manager = None
+        self.venv_threads = []
         self.install_thread = None
         self.executor = None
         self.current_highlight = None
@@ -156,14 +159,60 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            project_path = create_project(name, location)
+            # The venv is built on a background thread, see _on_venv_created
+            project_path = create_project(name, location, create_venv=False)
             self.set_current_project_path(project_path)
-            initialize_project_venv(project_path)
-            self.venv_manager = VenvManager(project_path)
+            self._start_venv_creation(project_path)
             print(f"New project created at: {project_path}")
         except FileExistsError as e:
             print(str(e))
 
+    def _start_venv_creation(self, project_path):
+        # Run and Install would use a half-built interpreter until the venv is ready
+        self.venv_manager = None
+        self.run_action.setEnabled(False)
+        self.install_deps_action.setEnabled(False)
+        self.status_bar.set_status("🟡 Creating venv...")
+
+        # Kept until the thread ends so closeEvent can wait for it, a superseded build included
+        venv_thread = VenvCreateThread(project_path, self)
+        venv_thread.finished_signal.connect(self._on_venv_created)
+        venv_thread.finished.connect(self._on_venv_thread_finished)
+        self.venv_threads.append(venv_thread)
+
+        self.console.write("=== Creating virtual environment ===")
+        venv_thread.start()
+
+    def _on_venv_created(self, success):
+        # The user may have closed or switched projects while the venv was built
+        project_path = Path(self.sender().project_path)
+        if self.current_project_path != project_path:
+            return
+
+        if success:
+            self.venv_manager = initialize_project_venv(project_path)
+            self.reload_script()
+            self.run_action.setEnabled(True)
+            self.install_deps_action.setEnabled(True)
+            self.console.write("=== Virtual environment ready ===")
+            self.status_bar.set_status("🟢 Ready")
+        else:
+            self.console.write("=== Virtual environment creation failed ===")
+            self.status_bar.set_status("🔴 Venv creation failed")
+
+    def _on_venv_thread_finished(self):
+        venv_thread = self.sender()
+        self.venv_threads.remove(venv_thread)
+        venv_thread.deleteLater()
+
+    def closeEvent(self, event):
+        # Destroying a running QThread aborts the process and leaves a half-built .venv
+        if self.venv_threads:
+            print("Waiting for the virtual environment to finish building...")
+            for venv_thread in self.venv_threads:
+                venv_thread.wait()
+        super().closeEvent(event)
+
     def open_file(self):
         project_path = QFileDialog.getExistingDirectory(self, "Open Folder")
 
@@ -171,11 +220,7 @@ class MainWindow(QMainWindow):
             print("Invalid PyWorks project folder.")
             return
 
-        for connection in self.canvas.scene.connections:
-            if hasattr(connection, 'timer'):
-                connection.timer.stop()
         self.canvas.scene.clear()
-        self.canvas.scene.connections = []
         self.set_current_project_path(project_path)
 
         initialize_project_venv(project_path)
@@ -249,11 +294,7 @@ class MainWindow(QMainWindow):
 
 
     def close_current_project(self):
-        for connection in self.canvas.scene.connections:
-            if hasattr(connection, 'timer'):
-                connection.timer.stop()
         self.canvas.scene.clear()
-        self.canvas.scene.connections = []
         self.editor.clear()
 
         self.current_project_path = None
@@ -343,8 +384,7 @@ class MainWindow(QMainWindow):
     def run_workflow(self):
         # Load Json
         self.layout_path = self.current_project_path / ".layout.json"
-        with open(self.layout_path, 'r', encoding='utf-8') as f:
-            self.layout_data = json.load(f)
+        self.layout_data = self.layout_manager.read_layout_data(self.layout_path)
         
         # Validate venv
         if self.venv_manager is None:
@@ -459,6 +499,8 @@ class MainWindow(QMainWindow):
 
 
 def main():
+    # Show INFO and up next to the existing print output, module loggers carry the save/project messages
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     app = QApplication(sys.argv)
     window = MainWindow()
     window.showMaximized()
@@ -5,6 +5,7 @@ from PyQt6.QtGui import QPainter, QColor, QPainterPath, QPen, QTransform
 from ui.nodes.node_item import NodeItem
 from ui.nodes.port import PortItem
 from ui.nodes.connection_item import ConnectionBridge
+from ui.nodes import palette
 
 
 class CanvasGraphicsView(QGraphicsView):
@@ -100,21 +101,54 @@ class CanvasGraphicsScene(QGraphicsScene):
     def __init__(self, parent=None, grid_size=20, radius=10):
         super().__init__(parent)
         self.setBackgroundBrush(QColor("#222"))
+        # Nodes are dragged constantly and drag their bridges with them, keeping a BSP
+        # tree up to date costs more than scanning a workflow-sized item list
+        self.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         self.gridSize = grid_size
         self.radius = radius
         self.temp_connection = None
+        # Whole-pixel cursor position the temporary connection was last drawn to
+        self.temp_connection_end = None
         self.connection_start_port = None
         self.is_drawing_connection = False
         self.connections = []
         self.nodes_by_id = {}
 
+        # Kept current here so the status bar never has to scan the scene
+        self.selected_node_count = 0
+        self.selectionChanged.connect(self._update_selected_node_count)
+
     def addItem(self, item):
-        """Override addItem to connect NodeItem signals."""
+        """Override addItem to connect NodeItem signals and track nodes and connections."""
         super().addItem(item)
         # Connect nodeDoubleClicked signal from NodeItem to scene signal
         if isinstance(item, NodeItem):
             self.nodes_by_id[item.id] = item
             item.nodeDoubleClicked.connect(self.nodeDoubleClicked.emit)
+        elif isinstance(item, ConnectionBridge):
+            self.connections.append(item)
+
+    def removeItem(self, item):
+        """Override removeItem to keep nodes_by_id and connections in sync."""
+        super().removeItem(item)
+        if isinstance(item, NodeItem):
+            self.nodes_by_id.pop(item.id, None)
+        elif isinstance(item, ConnectionBridge) and item in self.connections:
+            self.connections.remove(item)
+
+    def clear(self):
+        """Override clear, which deletes items without going through removeItem."""
+        super().clear()
+        self.nodes_by_id.clear()
+        self.connections.clear()
+        self.selected_node_count = 0
+
+    def node_count(self):
+        return len(self.nodes_by_id)
+
+    def _update_selected_node_count(self):
+        self.selected_node_count = sum(1 for item in self.selectedItems()
+                                       if isinstance(item, NodeItem))
 
     def set_node_highlight(self, node_id: str, state: bool):
         node_to_highlight = self.nodes_by_id.get(node_id)
@@ -146,9 +180,9 @@ class CanvasGraphicsScene(QGraphicsScene):
         # Backspace or delete for removing nodes
         if event.key() in (Qt.Key.Key_Delete, Qt.Key.Key_Backspace):
             for item in self.selectedItems():
-                self.removeItem(item)
-                if isinstance(item, ConnectionBridge):
-                    self.connections.remove(item)
+                # A selected bridge may already be gone with its selected node
+                if item.scene() is self:
+                    self.removeItem(item)
         else:
             super().keyPressEvent(event)
 
@@ -167,25 +201,30 @@ class CanvasGraphicsScene(QGraphicsScene):
             if self.temp_connection is None:
                 self.temp_connection = QGraphicsPathItem()
                 if self.connection_start_port.port_type == "FLOW":
-                    color = QColor(110, 110, 110)
+                    color = palette.FLOW_COLOR
                 elif self.connection_start_port.port_type == "DATA":
-                    color = QColor(138, 43, 226) 
+                    color = palette.DATA_COLOR
                 self.temp_connection.setPen(QPen(color, 2, Qt.PenStyle.DashLine))
                 self.addItem(self.temp_connection)
                 self.temp_connection.setZValue(-1)
 
-            start_pos = self.connection_start_port.get_center_pos()
             end_pos = event.scenePos()
 
-            path = ConnectionBridge.create_orthogonal_path_between_points(
-              start_pos,
-              end_pos,
-              self.connection_start_port.port_type,
-              self.connection_start_port.scenePos().y(),
-              end_pos.y()  # Mouse cursor's y position acts as target_y
-            )
-
-            self.temp_connection.setPath(path)
+            # Sub-pixel cursor moves would rebuild an identical-looking path
+            end_key = (round(end_pos.x()), round(end_pos.y()))
+            if end_key != self.temp_connection_end:
+                self.temp_connection_end = end_key
+                start_pos = self.connection_start_port.get_center_pos()
+
+                path = ConnectionBridge.create_orthogonal_path_between_points(
+                  start_pos,
+                  end_pos,
+                  self.connection_start_port.port_type,
+                  self.connection_start_port.scenePos().y(),
+                  end_pos.y()  # Mouse cursor's y position acts as target_y
+                )
+
+                self.temp_connection.setPath(path)
         super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event):
@@ -202,11 +241,11 @@ class CanvasGraphicsScene(QGraphicsScene):
                 if can_connect:
                     connection = ConnectionBridge(self.connection_start_port, target_port)
                     self.addItem(connection)
-                    self.connections.append(connection)
 
             if self.temp_connection:
                 self.removeItem(self.temp_connection)
                 self.temp_connection = None
+                self.temp_connection_end = None
 
             self.is_drawing_connection = False
             self.connection_start_port = None
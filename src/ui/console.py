@@ -1,5 +1,5 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QLineEdit, QApplication
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QLineEdit
+from PyQt6.QtCore import pyqtSignal, Qt, QTimer
 
 class ConsoleWidget(QWidget):
     input_submitted = pyqtSignal(str)
@@ -22,12 +22,23 @@ class ConsoleWidget(QWidget):
         layout.addWidget(self.input_widget)
         self.setLayout(layout)
 
+        # Lines queued for the next flush, so bursts of output paint once per frame
+        self._pending = []
+
         self.write("Application started...")
 
     def write(self, message):
-        self.output_view.append(message)
-        QApplication.processEvents()
-        self.output_view.verticalScrollBar().setValue(self.output_view.verticalScrollBar().maximum())
+        if not self._pending:
+            QTimer.singleShot(16, self._flush)
+        self._pending.append(message)
+
+    def _flush(self):
+        if not self._pending:
+            return
+        self.output_view.append("\n".join(self._pending))
+        self._pending.clear()
+        scroll_bar = self.output_view.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
 
     def on_input_submitted(self):
         text = self.input_widget.text()
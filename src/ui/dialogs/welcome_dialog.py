@@ -3,6 +3,63 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLa
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
+# Shared fonts and button styles, built once at import
+_TITLE_FONT = QFont()
+_TITLE_FONT.setPointSize(18)
+_TITLE_FONT.setBold(True)
+
+_SUB_FONT = QFont()
+_SUB_FONT.setPointSize(12)
+
+_NEW_BTN_QSS = """
+    QPushButton {
+        background-color: transparent;
+        color: white;
+        border: 2px solid #4285F4;
+        border-radius: 8px;
+        font-size: 14px;
+        font-weight: bold;
+        padding: 10px 20px;
+    }
+    QPushButton:hover {
+        background-color: #5294ff;
+    }
+    QPushButton:pressed {
+        background-color: #3275e4;
+    }
+"""
+
+_OPEN_BTN_QSS = """
+    QPushButton {
+        background-color: transparent;
+        color: white;
+        border: 2px solid #34A853;
+        border-radius: 8px;
+        font-size: 14px;
+        font-weight: bold;
+        padding: 10px 20px;
+    }
+    QPushButton:hover {
+        background-color: #44b863;
+    }
+    QPushButton:pressed {
+        background-color: #2a9843;
+    }
+"""
+
+_CANCEL_BTN_QSS = """
+    QPushButton {
+        background-color: transparent;
+        color: #666;
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        padding: 5px 15px;
+    }
+    QPushButton:hover {
+        background-color: #f0f0f0;
+    }
+"""
+
 class WelcomeDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -32,18 +89,13 @@ class WelcomeDialog(QDialog):
 
         # Welcome title
         title = QLabel("Welcome to PyWorks")
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(_TITLE_FONT)
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
         # Subtitle
         subtitle = QLabel("Visual Python Workflow Editor")
-        subtitle_font = QFont()
-        subtitle_font.setPointSize(12)
-        subtitle.setFont(subtitle_font)
+        subtitle.setFont(_SUB_FONT)
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
         subtitle.setStyleSheet("color: #888;")
         layout.addWidget(subtitle)
@@ -66,46 +118,14 @@ class WelcomeDialog(QDialog):
         # New Project Button
         self.new_btn = QPushButton("Create New Project")
         self.new_btn.setMinimumHeight(60)
-        self.new_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: white;
-                border: 2px solid #4285F4;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 10px 20px;
-            }
-            QPushButton:hover {
-                background-color: #5294ff;
-            }
-            QPushButton:pressed {
-                background-color: #3275e4;
-            }
-        """)
+        self.new_btn.setStyleSheet(_NEW_BTN_QSS)
         self.new_btn.clicked.connect(self._on_new_project)
         button_layout.addWidget(self.new_btn)
 
         # Open Project Button
         self.open_btn = QPushButton("Open Existing Project")
         self.open_btn.setMinimumHeight(60)
-        self.open_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: white;
-                border: 2px solid #34A853;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 10px 20px;
-            }
-            QPushButton:hover {
-                background-color: #44b863;
-            }
-            QPushButton:pressed {
-                background-color: #2a9843;
-            }
-        """)
+        self.open_btn.setStyleSheet(_OPEN_BTN_QSS)
         self.open_btn.clicked.connect(self._on_open_project)
         button_layout.addWidget(self.open_btn)
 
@@ -117,18 +137,7 @@ class WelcomeDialog(QDialog):
         # Cancel button (smaller, at bottom)
         cancel_btn = QPushButton("Cancel")
         cancel_btn.setMaximumWidth(100)
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #666;
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                padding: 5px 15px;
-            }
-            QPushButton:hover {
-                background-color: #f0f0f0;
-            }
-        """)
+        cancel_btn.setStyleSheet(_CANCEL_BTN_QSS)
         cancel_btn.clicked.connect(self.reject)
 
         cancel_layout = QHBoxLayout()
@@ -1,21 +1,127 @@
-import sys
+import logging
 from core import ast_utils
 from PyQt6.QtWidgets import QTextEdit
-from PyQt6.QtGui import QFont, QTextDocument, QTextCursor, QPainter, QPen, QColor, QFontMetrics
-from PyQt6.QtCore import Qt, QRect, QPoint
-
-import pygments
-import pygments.formatters.html
-from pygments.lexers import PythonLexer
-from pygments.formatters import TerminalFormatter
-from pygments import highlight
-import re
+from PyQt6.QtGui import QFont, QColor, QSyntaxHighlighter, QTextCharFormat
+
+logger = logging.getLogger(__name__)
+
+_pygments = None
+
+
+def _get_pygments():
+    """
+    Import Pygments on first use so it does not slow down application start.
+    Returns (lex, python_lexer, get_style_by_name, string_token).
+    """
+    global _pygments
+    if _pygments is None:
+        from pygments import lex
+        from pygments.lexers import PythonLexer
+        from pygments.styles import get_style_by_name
+        from pygments.token import String
+        _pygments = (lex, PythonLexer(), get_style_by_name, String)
+    return _pygments
+
+
+# Block states: which triple-quoted string, if any, is still open at the end of a line
+_NO_STRING = -1
+_TRIPLE_QUOTES = ('"""', "'''")
+
+
+class PythonHighlighter(QSyntaxHighlighter):
+    """
+    Highlight Python code using Pygments tokens.
+    Qt calls highlightBlock only for the lines that changed, so edits stay cheap.
+    Multi-line strings are carried between lines through the block state.
+    """
+    # Token type -> QTextCharFormat, shared by every highlighter
+    _formats = None
+
+    @staticmethod
+    def _build_formats(style_name):
+        _, _, get_style_by_name, _ = _get_pygments()
+        formats = {}
+        for token_type, token_style in get_style_by_name(style_name):
+            fmt = QTextCharFormat()
+            if token_style["color"]:
+                fmt.setForeground(QColor(f"#{token_style['color']}"))
+            if token_style["bold"]:
+                fmt.setFontWeight(QFont.Weight.Bold)
+            if token_style["italic"]:
+                fmt.setFontItalic(True)
+            formats[token_type] = fmt
+        return formats
+
+    def _format_for(self, token_type):
+        formats = PythonHighlighter._formats
+        fmt = formats.get(token_type)
+        if fmt is None:
+            # Fall back to the closest styled parent token, then remember it
+            parent = token_type.parent
+            while parent is not None and parent not in formats:
+                parent = parent.parent
+            fmt = formats.get(parent, QTextCharFormat())
+            formats[token_type] = fmt
+        return fmt
+
+    def highlightBlock(self, text):
+        previous_state = self.previousBlockState()
+
+        # Empty blocks need no formatting, and skipping them keeps an empty editor from importing Pygments
+        if not text:
+            self.setCurrentBlockState(previous_state)
+            return
+
+        lex, lexer, _, string_token = _get_pygments()
+        if PythonHighlighter._formats is None:
+            PythonHighlighter._formats = self._build_formats("monokai")
+
+        # Finish a string left open by an earlier line before lexing the rest
+        start = 0
+        open_quote = None
+        if previous_state != _NO_STRING:
+            quote = _TRIPLE_QUOTES[previous_state]
+            close = text.find(quote)
+            string_format = self._format_for(string_token)
+            if close == -1:
+                self.setFormat(0, len(text), string_format)
+                self.setCurrentBlockState(previous_state)
+                return
+            start = close + len(quote)
+            self.setFormat(0, start, string_format)
+
+        for token_type, value in lex(text[start:], lexer):
+            length = len(value)
+            self.setFormat(start, length, self._format_for(token_type))
+            start += length
+
+            # An unterminated triple quote shows up as a lone delimiter token
+            if token_type in string_token:
+                if value == open_quote:
+                    open_quote = None
+                elif open_quote is None and value in _TRIPLE_QUOTES:
+                    open_quote = value
+
+        if open_quote is None:
+            self.setCurrentBlockState(_NO_STRING)
+        else:
+            self.setCurrentBlockState(_TRIPLE_QUOTES.index(open_quote))
 
 
 class EditorWidget(QTextEdit):
     def __init__(self):
         super().__init__()
         self.setPlaceholderText("Start typing your code here...")
+        self.setStyleSheet("background-color: #272822; color: #f8f8f2;")
+
+        font = QFont()
+        font.setFamilies(["Consolas", "Fira Code", "JetBrains Mono", "monospace"])
+        font.setStyleHint(QFont.StyleHint.Monospace)
+        font.setPointSize(12)
+        self.setFont(font)
+
+        # Re-highlights only the edited blocks as the user types
+        self.highlighter = PythonHighlighter(self.document())
 
         # File tracking
         self.current_file_path = None
@@ -29,41 +135,6 @@ class EditorWidget(QTextEdit):
         if self.current_file_path and not self.is_dirty:
             self.is_dirty = True
 
-    def _highlight_code(self, code: str) -> str:
-        """
-        Highlight Python code using Pygments.
-        Returns a string with syntax highlighting (plain text with color tokens).
-        """
-        try:
-            # Use Python lexer
-            highlighted = highlight(
-                code,
-                PythonLexer(),
-                pygments.formatters.HtmlFormatter(
-                    style="monokai",       # use a dark style
-                    noclasses=True,        # inline styles instead of CSS classes
-                    linenums=False,
-                    full=False,
-                    prestyles=(
-                        "background: transparent; "
-                        "color: #f8f8f2; "
-                        "font-family: Consolas, 'Fira Code', 'JetBrains Mono', monospace; "
-                        "font-size: 12pt;"
-                    )
-                )
-            )
-            return highlighted  # This will render as HTML
-
-        except Exception as e:
-            print(f"Error highlighting code: {e}")
-            return code  # fallback
-
-    def _apply_highlighting(self, code: str):
-        # Create a QTextDocument and set HTML content
-        doc = QTextDocument()
-        doc.setHtml(code)
-        self.setDocument(doc)
-
     def show_function_context(self, metadata):
         try:
             # Temp disconnect to avoid false dirty trigger
@@ -71,11 +142,8 @@ class EditorWidget(QTextEdit):
 
             code = ast_utils.extract_function_with_imports(metadata.file_path, metadata.function_name)
 
-            # Highlight the code using Pygments HTML formatter
-            highlighted_html = self._highlight_code(code)
-
-            # Apply the highlighted HTML to the editor
-            self._apply_highlighting(highlighted_html)
+            # The highlighter colors the text as it is loaded
+            self.setPlainText(code)
 
             # Now begin tracking
             self.current_file_path = metadata.file_path
@@ -92,11 +160,11 @@ class EditorWidget(QTextEdit):
 
     def save(self):
         if not self.current_file_path:
-            print("No file loaded in editor")
+            logger.debug("No file loaded in editor")
             return False
 
         if not self.is_dirty:
-            print("No changes to save")
+            logger.debug("No changes to save")
             return False
 
         try:
@@ -108,13 +176,13 @@ class EditorWidget(QTextEdit):
 
             if success:
                 self.is_dirty = False
-                print(f"✓ Saved changes to {self.current_file_path.name}")
+                logger.info("Saved changes to %s", self.current_file_path.name)
                 return True
             else:
-                print("Failed to save function")
+                logger.warning("Failed to save function")
                 return False
         except Exception as e:
-            print(f"Error saving file: {e}")
+            logger.error("Error saving file: %s", e)
             return False
 
     def clear(self):
@@ -1,3 +1,5 @@
+import logging
+from functools import partial
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication, QMainWindow, QInputDialog, QTreeWidget, QTreeWidgetItem, QMenu, QMessageBox
 from PyQt6.QtCore import Qt, QMimeData, QPoint
@@ -5,6 +7,8 @@ from PyQt6.QtGui import QDrag
 
 from core.ast_utils import delete_function_from_file
 
+logger = logging.getLogger(__name__)
+
 STARTER_TEXT = '''
 import sys
 
@@ -20,6 +24,12 @@ def example(inputs, global_state):
 '''
 
 class NodeListWidget(QTreeWidget):
+    # Context menu entries for empty space, as (text, handler name)
+    _EMPTY_SPACE_ACTIONS = (
+        ("Refresh Tree", "handle_empty_space_action"),
+        ("Add New Category", "handle_add_category"),
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.main_window = parent
@@ -53,15 +63,24 @@ class NodeListWidget(QTreeWidget):
             category_group[cat].append((fqnn, metadata))
             self.project_path = metadata.file_path.parent
 
-        # Build the tree
+        # Build the tree detached from the widget so the view sees a single insert
+        category_items = []
         for category, nodes in category_group.items():
             category_item = QTreeWidgetItem([category])
-            self.addTopLevelItem(category_item)
 
+            function_items = []
             for fqnn, metadata in nodes:
                 function_item = QTreeWidgetItem([metadata.function_name])
                 function_item.setData(0, Qt.ItemDataRole.UserRole, fqnn)
-                category_item.addChild(function_item)
+                function_items.append(function_item)
+
+            category_item.addChildren(function_items)
+            category_items.append(category_item)
+
+        sorting_enabled = self.isSortingEnabled()
+        self.setSortingEnabled(False)
+        self.addTopLevelItems(category_items)
+        self.setSortingEnabled(sorting_enabled)
 
     def open_context_menu(self, position: QPoint):
         menu = QMenu(self)
@@ -69,19 +88,16 @@ class NodeListWidget(QTreeWidget):
 
         if item is None:
             # --- Empty space ---
-            actions = [
-                ("Refresh Tree", self.handle_empty_space_action),
-                ("Add New Category", self.handle_add_category),
-            ]
+            actions = [(text, getattr(self, handler)) for text, handler in self._EMPTY_SPACE_ACTIONS]
 
         elif item.parent() is None:
             # --- Top-level category ---
             name = item.text(0)
             actions = [
-                (f"Expand '{name}'", lambda: item.setExpanded(True)),
-                (f"Collapse '{name}'", lambda: item.setExpanded(False)),
-                ("Add New Node", lambda: self.handle_add_node(name)),
-                (f"Delete Category '{name}'", lambda: self.handle_delete_category(name)),
+                (f"Expand '{name}'", partial(item.setExpanded, True)),
+                (f"Collapse '{name}'", partial(item.setExpanded, False)),
+                ("Add New Node", partial(self.handle_add_node, name)),
+                (f"Delete Category '{name}'", partial(self.handle_delete_category, name)),
             ]
 
         else:
@@ -89,7 +105,7 @@ class NodeListWidget(QTreeWidget):
             name = item.text(0)
             category = item.parent().text(0)
             actions = [
-                (f"Delete '{name}'", lambda: self.handle_delete_item(category, name)),
+                (f"Delete '{name}'", partial(self.handle_delete_item, category, name)),
             ]
 
         # Add main actions to menu
@@ -118,13 +134,14 @@ class NodeListWidget(QTreeWidget):
 
         file_path = nodes_dir / f"{name}.py"
 
-        if file_path.exists():
+        # Generate the python file, "x" mode fails if it already exists
+        try:
+            with file_path.open("x") as f:
+                f.write(STARTER_TEXT)
+        except FileExistsError:
             QMessageBox.warning(self, "File Exists", f"{file_path.name} already exists.")
             return
 
-        # Generate the python file:
-        file_path.write_text(STARTER_TEXT)
-
         QMessageBox.information(self, "Node Created", f"Created: {file_path}")
         self.handle_empty_space_action()
 
@@ -136,18 +153,19 @@ class NodeListWidget(QTreeWidget):
 
         # Build path to nodes directory
         nodes_dir = self.project_path
-        nodes_dir.mkdir(parents=True, exist_ok=True)
 
         file_path = nodes_dir / f"{name}.py"
-        if file_path.exists():
-            with file_path.open("a", encoding="utf-8") as f:
+        # "r+" fails if the file is missing, unlike "a" which would create it
+        try:
+            with file_path.open("r+", encoding="utf-8") as f:
+                f.seek(0, 2)
                 f.write("\n\n")
                 f.write("@node\n")
                 f.write(f"def {func_name}(inputs, global_state):\n")
                 f.write("    message = 'New feature added!'\n")
                 f.write("    return {'result': message}\n")
-        else:
-            print("File not found.")
+        except FileNotFoundError:
+            logger.debug("File not found: %s", file_path)
 
         self.handle_empty_space_action()
 
@@ -156,31 +174,32 @@ class NodeListWidget(QTreeWidget):
 
         file_path = nodes_dir / f"{name}.py"
 
-        if file_path.exists():
+        try:
             file_path.unlink()  # deletes the file
-            print(f"Deleted {file_path}")
-            self.handle_empty_space_action()
-        else:
-            print("File not found.")
+        except FileNotFoundError:
+            logger.debug("File not found: %s", file_path)
+            return
+
+        logger.debug("Deleted %s", file_path)
+        self.handle_empty_space_action()
 
     def handle_delete_item(self, category, name):
         nodes_dir = self.project_path
-        nodes_dir.mkdir(parents=True, exist_ok=True)
 
         file_path = nodes_dir / f"{category}.py"
 
-        if not file_path.exists():
-            print(f"File not found: {file_path}")
+        try:
+            success = delete_function_from_file(file_path, name)
+        except FileNotFoundError:
+            logger.debug("File not found: %s", file_path)
             return
 
-        success = delete_function_from_file(file_path, name)
-
         if success:
-            print(f"Deleted {name} from {file_path}")
+            logger.debug("Deleted %s from %s", name, file_path)
             self.handle_empty_space_action()
 
     def handle_global_action(self):
-        print("Global action triggered")
+        logger.debug("Global action triggered")
             
 
 
@@ -1,97 +1,179 @@
+import weakref
+
 from PyQt6.QtWidgets import QGraphicsPathItem, QStyle
-from PyQt6.QtCore import QPointF, Qt, QTimer
-from PyQt6.QtGui import QPen, QColor, QPainterPath, QPainter
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QPen, QPainterPath, QPainter, QGuiApplication
 
-from ui.nodes.port import PortItem
-from ui.nodes.node_item import NodeItem
+from ui.nodes import palette
 
 class ConnectionBridge(QGraphicsPathItem):
+    # Marching-ants animation, one timer drives every bridge in a scene
+    # Dash offset in pen widths, taken modulo the 5+5 dash pattern period
+    _DASH_PERIOD = 10
+    _offset = 0
+    _ticks = 0
+    # Copies of the palette pens that paint moves the dash offset on, the palette stays untouched
+    _FLOW_ANT_PEN = QPen(palette.FLOW_PEN)
+    _DATA_ANT_PEN = QPen(palette.DATA_PEN)
+    _timer = None
+    _instances = weakref.WeakSet()
+
     def __init__(self, source_port, target_port, parent = None):
         super().__init__(parent)
 
-        # Animation init
-        self.offset = 1000
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(30)
-
         # Normalize ports
         if source_port.port_direction == "IN":
           source_port, target_port = target_port, source_port
 
         self.source_port = source_port
         self.target_port = target_port
+
+        # Register with both endpoint nodes so a node drag only touches its own bridges
+        source_port.parent_node._connections.append(self)
+        if target_port.parent_node is not source_port.parent_node:
+            target_port.parent_node._connections.append(self)
         self.setAcceptHoverEvents(True)
         self.is_hovered = False
         self.setFlag(QGraphicsPathItem.GraphicsItemFlag.ItemIsSelectable, True)
         
-        if source_port.port_type == "FLOW":
-            pen = QPen(QColor(110, 110, 110), 2)
-        elif source_port.port_type == "DATA":
-            pen = QPen(QColor(138, 43, 226), 2)
-
-        pen.setDashPattern([5, 5])
-        pen.setDashOffset(float(self.offset))
-        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-        pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
-        self.setPen(pen)
+        self.setPen(ConnectionBridge._base_pen(source_port.port_type))
 
         self.setZValue(-1)
 
+        # Endpoints the current path was built for
+        self._path_key = None
+        # A deferred update_path is already queued
+        self._dirty = False
         self.update_path()
 
+    @staticmethod
+    def _base_pen(port_type):
+        if port_type == "FLOW":
+            return palette.FLOW_PEN
+        return palette.DATA_PEN
+
+    @staticmethod
+    def _animated_pen(port_type):
+        if port_type == "FLOW":
+            return ConnectionBridge._FLOW_ANT_PEN
+        return ConnectionBridge._DATA_ANT_PEN
+
+    @staticmethod
+    def _glow_pen(port_type, is_selected):
+        if is_selected:
+            return palette.SELECTED_GLOW_PEN
+        if port_type == "FLOW":
+            return palette.FLOW_GLOW_PEN
+        return palette.DATA_GLOW_PEN
+
     def paint(self, painter, option, widget):
+        # Zoomed far out the dashes are too small for antialiasing to show
+        antialiased = painter.testRenderHint(QPainter.RenderHint.Antialiasing)
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        if lod < 0.5:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
 
-        pen = QPen(self.pen())
-        pen.setDashOffset(float(self.offset))
-        self.setPen(pen)
+        path = self.path()
+        painter.setBrush(Qt.BrushStyle.NoBrush)
 
-        is_selected = option.state & QStyle.StateFlag.State_Selected
+        is_selected = bool(option.state & QStyle.StateFlag.State_Selected)
         if self.is_hovered or is_selected:
-            if self.source_port.port_type == "FLOW":
-                glow_color = QColor(150, 150, 150, 100)
-            else:
-                glow_color = QColor(180, 100, 255, 120)
-            if is_selected:
-                glow_color = QColor(255, 255, 255, 60)
+            painter.setPen(ConnectionBridge._glow_pen(self.source_port.port_type, is_selected))
+            painter.drawPath(path)
+
+        # Draw the dashed line directly; going through setPen would invalidate geometry every frame.
+        # The animated pens are shared, every bridge sets them to the same offset anyway.
+        pen = ConnectionBridge._animated_pen(self.source_port.port_type)
+        pen.setDashOffset(ConnectionBridge._offset)
+        painter.setPen(pen)
+        painter.drawPath(path)
 
-            glow_pen = QPen(glow_color, 6)
-            glow_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-            glow_pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, antialiased)
 
-            painter.setPen(glow_pen)
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawPath(self.path())
-            
-        option.state &= ~QStyle.StateFlag.State_Selected
+    def update_path(self):
+        start_point = self.source_port.get_center_pos()
+        end_point = self.target_port.get_center_pos()
 
-        super().paint(painter, option, widget)
+        # Both ends unchanged since the last rebuild, keep the current path
+        path_key = (start_point.x(), start_point.y(), end_point.x(), end_point.y())
+        if path_key == self._path_key:
+            return
+        self._path_key = path_key
 
-    def update_path(self,):
-        path = self.create_orthogonal_path()
+        path = ConnectionBridge.create_orthogonal_path_between_points(
+            start_point, end_point, self.source_port.port_type, start_point.y(), end_point.y())
         self.setPath(path)
 
-    def update_animation(self):
-        self.offset -= 1
-        if self.offset < 10:
-            self.offset = 1000 
-        
-        self.update()
+    def update_path_deferred(self):
+        """Queue one update_path for the next event loop pass, however often this is called."""
+        if self._dirty:
+            return
+        self._dirty = True
+        QTimer.singleShot(0, self._flush_path)
+
+    def _flush_path(self):
+        self._dirty = False
+        try:
+            self.update_path()
+        except RuntimeError:
+            # Deleted with its scene before the queued update ran
+            pass
+
+    @classmethod
+    def _start_animation(cls):
+        if cls._timer is None:
+            # Tick once per display frame, there is no point animating faster
+            screen = QGuiApplication.primaryScreen()
+            refresh_rate = screen.refreshRate() if screen else 0
+            if refresh_rate <= 0:
+                refresh_rate = 60
+            cls._timer = QTimer()
+            cls._timer.setInterval(max(1, round(1000 / refresh_rate)))
+            cls._timer.timeout.connect(cls._tick)
+
+        if not cls._timer.isActive():
+            cls._timer.start()
+
+    @classmethod
+    def _tick(cls):
+        if not cls._instances:
+            cls._timer.stop()
+            return
+
+        # Same speed as the old one step per 30 ms, whatever the tick interval
+        cls._ticks += 1
+        offset = -(cls._ticks * cls._timer.interval() // 30) % cls._DASH_PERIOD
+        if offset == cls._offset:
+            # The dashes have not moved a whole step yet, nothing to repaint
+            return
+        cls._offset = offset
+
+        deleted = []
+        for bridge in cls._instances:
+            try:
+                bridge.update()
+            except RuntimeError:
+                # Destroyed on the C++ side by scene.clear(), which skips itemChange
+                deleted.append(bridge)
+        for bridge in deleted:
+            cls._instances.discard(bridge)
     
     @staticmethod
     def create_orthogonal_path_between_points(start_point, end_point, port_type, source_y, target_y):
-        start = start_point
-        end = end_point
+        # Work on plain floats, Qt's float overloads avoid building a QPointF per point
+        start_x, start_y = start_point.x(), start_point.y()
+        end_x, end_y = end_point.x(), end_point.y()
 
-        path = QPainterPath(start)
+        path = QPainterPath()
+        path.moveTo(start_x, start_y)
 
         # If perfectly horizontal or vertical, draw straight line
-        if start.y() == end.y() or start.x() == end.x():
-            path.lineTo(end)
+        if start_y == end_y or start_x == end_x:
+            path.lineTo(end_x, end_y)
             return path
 
         radius = 10
-        base_mid_x = (start.x() + end.x()) / 2
+        base_mid_x = (start_x + end_x) / 2
         # Otherwise, use curved orthogonal routing, based on node position and port type
         if port_type == "FLOW":
             if source_y < target_y:
@@ -104,29 +186,33 @@ class ConnectionBridge(QGraphicsPathItem):
             else:
                 mid_x = base_mid_x - 10
 
-        going_right = end.x() > start.x()
-        going_down = end.y() > start.y()
+        h_radius = radius if end_x > start_x else -radius
+        v_radius = radius if end_y > start_y else -radius
 
-        h_radius = radius if going_right else -radius
-        v_radius = radius if going_down else -radius
+        path.lineTo(mid_x - h_radius, start_y)
+        path.quadTo(mid_x, start_y, mid_x, start_y + v_radius)
+        path.lineTo(mid_x, end_y - v_radius)
+        path.quadTo(mid_x, end_y, mid_x + h_radius, end_y)
+        path.lineTo(end_x, end_y)
 
-        path.lineTo(mid_x - h_radius, start.y())
-        path.quadTo(QPointF(mid_x, start.y()), QPointF(mid_x, start.y() + v_radius))
-        path.lineTo(mid_x, end.y() - v_radius)
-        path.quadTo(QPointF(mid_x, end.y()), QPointF(mid_x + h_radius, end.y()))
-        path.lineTo(end)
-        
         return path
 
-    def create_orthogonal_path(self):
-        start_point = self.source_port.get_center_pos()
-        end_point = self.target_port.get_center_pos()
-        port_type = self.source_port.port_type
-        source_y = self.source_port.scenePos().y()
-        target_y = self.target_port.scenePos().y()
+    def itemChange(self, change, value):
+        if change == QGraphicsPathItem.GraphicsItemChange.ItemSceneChange:
+            if value is None:
+                ConnectionBridge._instances.discard(self)
+                self.detach()
+            else:
+                ConnectionBridge._instances.add(self)
+                ConnectionBridge._start_animation()
+        return super().itemChange(change, value)
+
+    def detach(self):
+        """Remove this bridge from its endpoint nodes' connection lists."""
+        for node in {self.source_port.parent_node, self.target_port.parent_node}:
+            if self in node._connections:
+                node._connections.remove(self)
 
-        return ConnectionBridge.create_orthogonal_path_between_points(start_point, end_point, port_type, source_y, target_y)
-    
     def hoverEnterEvent(self, event):
         self.is_hovered = True
         self.update()
@@ -136,8 +222,3 @@ class ConnectionBridge(QGraphicsPathItem):
         self.is_hovered = False
         self.update()
         super().hoverLeaveEvent(event)
-
-    def __del__(self):
-        if hasattr(self, 'timer'):
-            self.timer.stop()
-            self.timer.deleteLater()
\ No newline at end of file
@@ -1,10 +1,14 @@
-import sys
 import uuid
-from PyQt6.QtWidgets import QApplication, QMainWindow, QGraphicsItem, QGraphicsObject, QStyle
-from PyQt6.QtCore import QRectF, QMimeData, QPointF, Qt, pyqtSignal
-from PyQt6.QtGui import QPainter, QColor, QDrag, QPen, QBrush
+from PyQt6.QtWidgets import QGraphicsItem, QGraphicsObject, QStyle
+from PyQt6.QtCore import QRectF, QPointF, Qt, pyqtSignal
+from PyQt6.QtGui import QPainterPath
 
 from ui.nodes.port import PortItem
+from ui.nodes import palette
+
+# Nodes snap to the same grid the canvas draws
+GRID_SIZE = 20
+HALF_GRID = GRID_SIZE / 2
 
 class NodeItem(QGraphicsObject):
     # Signal emitted when node is double-clicked
@@ -15,10 +19,17 @@ class NodeItem(QGraphicsObject):
         # Node properties
         self.width = 140
         self.height = 80
+        # Qt asks for these many times per frame, so build them once
+        glow_margin = 5
+        self._bounding_rect = QRectF(-glow_margin, -glow_margin, self.width + glow_margin * 2, self.height + glow_margin * 2)
+        self._shape_path = QPainterPath()
+        self._shape_path.addRoundedRect(QRectF(0, 0, self.width, self.height), 10, 10)
         self.id = id if id is not None else uuid.uuid4().hex
         self.fqnn = fqnn
         self.category = fqnn.split('.')[0]
         self.function_name = fqnn.split('.')[1]
+        # ConnectionBridges attached to this node, maintained by the bridges themselves
+        self._connections = []
         self.add_ports()
         self.setAcceptHoverEvents(True)
         self.is_hovered = False
@@ -33,13 +44,21 @@ class NodeItem(QGraphicsObject):
             QGraphicsItem.GraphicsItemFlag.ItemIsSelectable |
             QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges
         )
+
+        # Repaints blit a cached pixmap, update() refreshes it on state changes
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
     
     def set_executing(self, executing: bool):
         self.is_executing = executing
         self.update()
 
     def boundingRect(self):
-        return QRectF(0, 0, self.width, self.height)
+        # Includes the hover/executing glow so the cached pixmap is not clipped
+        return self._bounding_rect
+
+    def shape(self):
+        # Clicks and selection only hit the node body, not the glow margin
+        return self._shape_path
     
     def paint(self, painter, option, widget):
         radius = 10
@@ -47,7 +66,7 @@ class NodeItem(QGraphicsObject):
         is_selected = option.state & QStyle.StateFlag.State_Selected
 
         if self.is_executing:
-            glow_color = QColor(0, 255, 0, 150) # Green glow
+            glow_color = palette.EXEC_GLOW # Green glow
             glow_size = 3
             painter.setPen(Qt.PenStyle.NoPen)
             painter.setBrush(glow_color)
@@ -61,9 +80,9 @@ class NodeItem(QGraphicsObject):
         elif self.is_hovered:
             # Determine glow color
             if is_selected:
-                glow_color = QColor(66, 133, 244, 80)
+                glow_color = palette.HOVER_GLOW_SEL
             else:
-                glow_color = QColor(255, 255, 255, 40)
+                glow_color = palette.HOVER_GLOW
 
             glow_size = 4
             painter.setPen(Qt.PenStyle.NoPen)
@@ -77,45 +96,37 @@ class NodeItem(QGraphicsObject):
                     )
             
         if is_selected:
-            border_pen = QPen(QColor("#4285F4"), 1.5)
+            border_pen = palette.SELECTED_PEN
         else: 
-            border_pen= QPen(QColor("#888"), 1.5)
+            border_pen = palette.NORMAL_PEN
 
-        painter.setBrush(QColor("#444"))
+        painter.setBrush(palette.NODE_BRUSH)
         painter.setPen(border_pen)
         painter.drawRoundedRect(0, 0, self.width, self.height, radius, radius)
-        painter.setPen(QColor("#fff"))
+        painter.setPen(palette.TEXT_PEN)
         painter.drawText(10, 20, self.function_name)
     
-    def get_status_color(self):
-        colors = {
-            "idle": "#444",
-            "running": "#4a4",
-            "error": "#a44"
-        }
-        return colors.get(getattr(self, '_status', 'idle'), "#444")
-    
     def itemChange(self, change, value):
         if change == QGraphicsItem.GraphicsItemChange.ItemPositionChange:
-            scene_pos_x = round(value.x() / 20) * 20
-            scene_pos_y = round(value.y() / 20) * 20
+            # Floor division rounds to the nearest grid line without a round() call
+            scene_pos_x = (value.x() + HALF_GRID) // GRID_SIZE * GRID_SIZE
+            scene_pos_y = (value.y() + HALF_GRID) // GRID_SIZE * GRID_SIZE
+
+            # Most drag events stay inside the same grid cell, nothing moves
+            current_pos = self.pos()
+            if scene_pos_x == current_pos.x() and scene_pos_y == current_pos.y():
+                return current_pos
             new_pos = QPointF(scene_pos_x, scene_pos_y)
 
-            if self.scene() and hasattr(self.scene(), 'connections'):
-                for connection in self.scene().connections:
-                    if connection.source_port in self.ports or connection.target_port in self.ports:
-                        connection.update_path()
+            # Deferred, so a burst of moves costs one path rebuild and uses the final position
+            for connection in self._connections:
+                connection.update_path_deferred()
             return new_pos
         elif change == QGraphicsItem.GraphicsItemChange.ItemSceneChange:
             if value is None and self.scene():
-                connections_to_remove = []
-                for connection in self.scene().connections:
-                    if connection.source_port in self.ports or connection.target_port in self.ports:
-                        connections_to_remove.append(connection)
-
-                for connection in connections_to_remove:
+                # Copy, removing a bridge detaches it from this list
+                for connection in self._connections[:]:
                     self.scene().removeItem(connection)
-                    self.scene().connections.remove(connection)
         return super().itemChange(change, value)
 
     def add_ports(self):
@@ -132,6 +143,12 @@ class NodeItem(QGraphicsObject):
         self.output_flow.setPos(self.width, 50)
 
         self.ports = [self.input_data, self.output_data, self.input_flow, self.output_flow]
+        self.ports_by_key = {
+            ("DATA", "IN"): self.input_data,
+            ("DATA", "OUT"): self.output_data,
+            ("FLOW", "IN"): self.input_flow,
+            ("FLOW", "OUT"): self.output_flow
+        }
 
     def hoverEnterEvent(self, event):
         self.is_hovered = True
@@ -0,0 +1,41 @@
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QPen, QBrush
+
+# Colors, pens and brushes shared by every node, port and connection.
+# Built once at import so paint() never constructs them per frame.
+
+
+def _connection_pen(color, width, dashed=False):
+    pen = QPen(color, width)
+    if dashed:
+        pen.setDashPattern([5, 5])
+    pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+    pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
+    # Same on-screen width at any zoom, no scaled-up stroke to rasterize
+    pen.setCosmetic(True)
+    return pen
+
+
+# Nodes
+NODE_BRUSH = QBrush(QColor("#444"))
+NORMAL_PEN = QPen(QColor("#888"), 1.5)
+SELECTED_PEN = QPen(QColor("#4285F4"), 1.5)
+TEXT_PEN = QPen(QColor("#fff"))
+EXEC_GLOW = QBrush(QColor(0, 255, 0, 150))
+HOVER_GLOW_SEL = QBrush(QColor(66, 133, 244, 80))
+HOVER_GLOW = QBrush(QColor(255, 255, 255, 40))
+
+# Ports
+PORT_DATA_FILL = QBrush(QColor("#2196F3"))
+PORT_FLOW_FILL = QBrush(QColor("#4CAF50"))
+PORT_DATA_BORDER = QPen(QColor("#1565C0"), 1.5)
+PORT_FLOW_BORDER = QPen(QColor("#2E7D32"), 1.5)
+
+# Connections
+FLOW_COLOR = QColor(110, 110, 110)
+DATA_COLOR = QColor(138, 43, 226)
+FLOW_PEN = _connection_pen(FLOW_COLOR, 2, dashed=True)
+DATA_PEN = _connection_pen(DATA_COLOR, 2, dashed=True)
+FLOW_GLOW_PEN = _connection_pen(QColor(150, 150, 150, 100), 6)
+DATA_GLOW_PEN = _connection_pen(QColor(180, 100, 255, 120), 6)
+SELECTED_GLOW_PEN = _connection_pen(QColor(255, 255, 255, 60), 6)
@@ -1,9 +1,29 @@
 
 from PyQt6.QtWidgets import QGraphicsItem
 from PyQt6.QtCore import QRectF, QPointF
-from PyQt6.QtGui import QColor, QPen, QBrush, QPolygonF
+from PyQt6.QtGui import QPolygonF, QPainterPath, QPainter
+
+from ui.nodes import palette
+
+def _shape_from(polygon=None, rect=None):
+    path = QPainterPath()
+    if polygon is not None:
+        path.addPolygon(polygon)
+        path.closeSubpath()
+    else:
+        path.addEllipse(rect)
+    return path
+
 
 class PortItem(QGraphicsItem):
+    # Every port has the same geometry, so it is built once for the class
+    _OUT_TRIANGLE = QPolygonF([QPointF(6, 0), QPointF(-6, -6), QPointF(-6, 6)])
+    _IN_RECT = QRectF(-6, -6, 12, 12)
+    # Padded by the border pen so the cached pixmap keeps the full outline
+    _BOUNDING_RECT = QRectF(-7, -7, 14, 14)
+    _OUT_SHAPE = _shape_from(polygon=_OUT_TRIANGLE)
+    _IN_SHAPE = _shape_from(rect=_IN_RECT)
+
     def __init__(self, port_type, port_direction, parent_node, parent=None):
         super().__init__(parent)
         self.port_type = port_type
@@ -13,40 +33,52 @@ class PortItem(QGraphicsItem):
         self.setFlags(
             QGraphicsItem.GraphicsItemFlag.ItemIsSelectable
         )
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+        if port_direction == "OUT":
+            self._shape_path = PortItem._OUT_SHAPE
+        else:
+            self._shape_path = PortItem._IN_SHAPE
+
+        # Position within parent_node, kept by setPos
+        self._local_offset = QPointF(0, 0)
+
+    def setPos(self, *args):
+        super().setPos(*args)
+        self._local_offset = self.pos()
     
     def boundingRect(self):
-        radius = 6
-        return QRectF(-radius, -radius, radius*2, radius*2)
+        return PortItem._BOUNDING_RECT
+
+    def shape(self):
+        return self._shape_path
     
     def paint(self, painter, option, widget):
-        radius = 6
-        
+        # A 12px port only benefits from antialiasing once zoomed in
+        antialiased = painter.testRenderHint(QPainter.RenderHint.Antialiasing)
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, lod > 1.5)
+
         if self.port_type == "DATA":
-            self.port_color = QPen(QColor("#2196F3"))
-            border_color = QColor("#1565C0")
+            painter.setPen(palette.PORT_DATA_BORDER)
+            painter.setBrush(palette.PORT_DATA_FILL)
         elif self.port_type == "FLOW":
-            self.port_color = QPen(QColor("#4CAF50"))
-            border_color = QColor("#2E7D32")
-            
-        painter.setPen(QPen(border_color, 1.5))
-        painter.setBrush(QBrush(self.port_color.color()))
+            painter.setPen(palette.PORT_FLOW_BORDER)
+            painter.setBrush(palette.PORT_FLOW_FILL)
 
         if self.port_direction == "OUT":
-            triangle = QPolygonF([
-                QPointF(radius, 0),
-                QPointF(-radius, -radius), 
-                QPointF(-radius, radius)
-            ])
-            painter.drawPolygon(triangle)
+            painter.drawPolygon(PortItem._OUT_TRIANGLE)
         elif self.port_direction == "IN":
-            painter.drawEllipse(self.boundingRect())
+            painter.drawEllipse(PortItem._IN_RECT)
+
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, antialiased)
 
         
 
     def get_center_pos(self):
-        radius = 5
-        self.center_pos = self.scenePos()
-        return self.center_pos
+        # Ports are direct children of a top-level node, so this equals scenePos()
+        # without walking the item transform chain
+        return self.parent_node.pos() + self._local_offset
 
     def can_connect_to(self, other_port):
         # Prevent connecting to self
@@ -42,10 +42,8 @@ class StatusBarWidget(QStatusBar):
               self.project_label.setText("No project")
 
     def update_canvas_stats(self, scene):
-        from ui.nodes.node_item import NodeItem
-        # Count only NodeItem instances (ignore ports, connections, etc)
-        node_count = sum(1 for item in scene.items()
-                        if isinstance(item, NodeItem))
+        # The scene tracks its nodes, so no need to walk every item
+        node_count = scene.node_count()
         connection_count = len(scene.connections)
 
         text = f"{node_count} nodes, {connection_count} connections"
@@ -68,10 +66,7 @@ class StatusBarWidget(QStatusBar):
 
 
     def update_selection(self, scene):
-        from ui.nodes.node_item import NodeItem
-
-        selected = sum(1 for item in scene.selectedItems()
-                        if isinstance(item, NodeItem))
+        selected = scene.selected_node_count
 
         if selected > 0:
             plural = "node" if selected == 1 else "nodes"
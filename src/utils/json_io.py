@@ -0,0 +1,21 @@
+import json
+
+# orjson is optional, it is much faster on large layouts
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(data) -> bytes:
+    # Compact output, layout files are only ever read back by PyWorks
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def loads(raw: bytes):
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, callers catch the stdlib one
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
@@ -1,9 +1,22 @@
 import json
+import logging
+from pathlib import Path
 from PyQt6.QtWidgets import QGraphicsItem, QStyle
 from PyQt6.QtCore import QRectF, QPointF, Qt
 
 from ui.nodes.node_item import NodeItem
 from ui.nodes.connection_item import ConnectionBridge
+from utils import json_io
+
+logger = logging.getLogger(__name__)
+
+
+def _node_fqnn(node_data) -> str:
+    # Backward compatibility for old layout files
+    if "fqnn" in node_data:
+        return node_data["fqnn"]
+    # Old format used category and function to build fqnn
+    return f"{node_data['category']}.{node_data['function']}"
 
 
 class LayoutManager():
@@ -18,106 +31,102 @@ class LayoutManager():
             "connections": []
         }
 
-        for item in scene.items():
-            if isinstance(item, NodeItem):
-                layout_data["nodes"][item.id] = {
-                    "fqnn": item.fqnn,
-                    "x": item.pos().x(), 
-                    "y": item.pos().y()
-                    }
+        # The scene keeps its nodes by id, no need to walk and type-check every item.
+        # pos() builds a new QPointF, so ask for it once per node.
+        nodes = layout_data["nodes"]
+        for node_id, item in scene.nodes_by_id.items():
+            pos = item.pos()
+            nodes[node_id] = {"fqnn": item.fqnn, "x": pos.x(), "y": pos.y()}
 
+        conn_append = layout_data["connections"].append
         for connection in scene.connections:
-            source_node_id = connection.source_port.parent_node.id
-            target_node_id = connection.target_port.parent_node.id
+            source_port = connection.source_port
+            target_port = connection.target_port
 
             connection_data = {
-                "source_node_id": source_node_id,
-                "source_port_type": connection.source_port.port_type,
-                "source_port_direction": connection.source_port.port_direction,
-                "target_node_id": target_node_id,
-                "target_port_type": connection.target_port.port_type,
-                "target_port_direction": connection.target_port.port_direction
+                "source_node_id": source_port.parent_node.id,
+                "source_port_type": source_port.port_type,
+                "source_port_direction": source_port.port_direction,
+                "target_node_id": target_port.parent_node.id,
+                "target_port_type": target_port.port_type,
+                "target_port_direction": target_port.port_direction
             }
 
-            layout_data["connections"].append(connection_data)
+            conn_append(connection_data)
             
+        # Serialize fully in memory, then hand the file one write
+        payload = json_io.dumps(layout_data)
         try:
-            with open(file_path, 'w') as f:
-                    json.dump(layout_data, f, indent = 2)
-                    return True
-        except Exception as e:
-            print(f"Error saving layout: {e}")
+            Path(file_path).write_bytes(payload)
+            return True
+        except OSError as e:
+            logger.error("Error saving layout: %s", e)
             return False
         
+    def read_layout_data(self, file_path):
+        """Read and parse a layout file. Raises OSError or json.JSONDecodeError."""
+        with open(file_path, 'rb') as f:
+            logger.debug("Layout file found: %s", file_path)
+            return json_io.loads(f.read())
+
     def load_layout(self, scene, file_path):
         try:
-            with open(file_path, 'r') as f:
-                print(f"Layout file found: {file_path}")
-                layout_data = json.load(f)
+            layout_data = self.read_layout_data(file_path)
         except FileNotFoundError:
             # Handle: file doesn't exist
-            print(f"Layout file not found: {file_path}")
+            logger.warning("Layout file not found: %s", file_path)
             return False
         except json.JSONDecodeError:
             # Handle: file exists but has bad JSON
-            print(f"Error parsing layout file: {file_path}")
+            logger.error("Error parsing layout file: %s", file_path)
             return False
         
-        node_dict ={}
-
-        for node_id, node_data in layout_data["nodes"].items():
-            # Backward compatibility for old layout files
-            if "fqnn" in node_data:
-                fqnn = node_data["fqnn"]
-            else:
-                # Old format used category and function to build fqnn
-                fqnn = f"{node_data['category']}.{node_data['function']}"
-
-            x = node_data["x"]
-            y = node_data["y"]
-
-            node = NodeItem(fqnn, x, y, id=node_id)
-            scene.addItem(node)
-            node_dict[node_id] = node
-
-        source_port = None
-
-        for connection_data in layout_data['connections']:
-            # Backward compatibility for old connection keys
-            source_node_id = connection_data.get("source_node_id") or connection_data.get("source_node_key")
-            target_node_id = connection_data.get("target_node_id") or connection_data.get("target_node_key")
-
-            source_node = node_dict.get(source_node_id)
-            target_node = node_dict.get(target_node_id)
-
-            if source_node is None:
-                print(f"Warning: Source node '{source_node_id}' not found. Skipping connection.")
-                continue
-            if target_node is None:
-                print(f"Warning: Target node '{target_node_id}' not found. Skipping connection.")
-                continue
-
-            source_port = None
-            for port in source_node.ports:
-                if port.port_type == connection_data["source_port_type"] and port.port_direction == connection_data["source_port_direction"]:
-                    source_port = port
-                    break
-
-            target_port = None
-            for port in target_node.ports:
-                if port.port_type == connection_data["target_port_type"] and port.port_direction == connection_data["target_port_direction"]:
-                    target_port = port
-                    break
-
-            if source_port is None:
-                print(f"Warning: Source port not found for connection. Skipping.")
-                continue
-            if target_port is None:
-                print(f"Warning: Target port not found for connection. Skipping.")
-                continue
-
-            connection = ConnectionBridge(source_port, target_port)
-            scene.addItem(connection)
-            scene.connections.append(connection)
+        # The scene already uses NoIndex, so adds only pay for signal emission.
+        # Keep it quiet during the bulk add and repaint once at the end.
+        was_blocked = scene.blockSignals(True)
+        # Locals for the names the loops below look up on every item
+        add_item = scene.addItem
+        try:
+            # Build every node in one tight pass, then hand them to the scene
+            node_dict = {
+                node_id: NodeItem(_node_fqnn(node_data), node_data["x"], node_data["y"], id=node_id)
+                for node_id, node_data in layout_data["nodes"].items()
+            }
+            for node in node_dict.values():
+                add_item(node)
+
+            get_node = node_dict.get
+            for connection_data in layout_data['connections']:
+                get_field = connection_data.get
+                # Backward compatibility for old connection keys
+                source_node_id = get_field("source_node_id") or get_field("source_node_key")
+                target_node_id = get_field("target_node_id") or get_field("target_node_key")
+
+                source_node = get_node(source_node_id)
+                target_node = get_node(target_node_id)
+
+                if source_node is None:
+                    logger.debug("Source node '%s' not found. Skipping connection.", source_node_id)
+                    continue
+                if target_node is None:
+                    logger.debug("Target node '%s' not found. Skipping connection.", target_node_id)
+                    continue
+
+                source_port = source_node.ports_by_key.get(
+                    (connection_data["source_port_type"], connection_data["source_port_direction"]))
+                target_port = target_node.ports_by_key.get(
+                    (connection_data["target_port_type"], connection_data["target_port_direction"]))
+
+                if source_port is None:
+                    logger.debug("Source port not found for connection. Skipping.")
+                    continue
+                if target_port is None:
+                    logger.debug("Target port not found for connection. Skipping.")
+                    continue
+
+                add_item(ConnectionBridge(source_port, target_port))
+        finally:
+            scene.blockSignals(was_blocked)
+        scene.update()
 
         return True
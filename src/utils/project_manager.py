@@ -1,7 +1,13 @@
 import json
+import logging
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from core.venv_manager import VenvManager
+from utils import json_io
+
+logger = logging.getLogger(__name__)
 
 
 # Default template with example nodes
@@ -43,8 +49,16 @@ def receive_example(inputs, global_state):
     return {"processed": data.upper()}
 '''
 
+# Encoded once, create_project writes these as is
+_EXAMPLE_CATEGORY_BYTES = EXAMPLE_CATEGORY_TEMPLATE.encode('utf-8')
+_REQUIREMENTS_BYTES = b"# Add your project dependencies here\n# Example:\n# numpy>=1.21.0\n# pandas>=1.3.0\n"
+_EMPTY_LAYOUT_BYTES = b'{"version":"1.0","nodes":{},"connections":[]}'
+
+# Bytes of .layout.json scanned for the required keys before falling back to a full parse
+_LAYOUT_HEAD_SIZE = 4096
 
-def create_project(name: str, location: str) -> Path:
+
+def create_project(name: str, location: str, *, create_venv: bool = True) -> Path:
     # Create project folder path
     project_path = Path(location) / name
     nodes_dir = project_path / "nodes"
@@ -57,56 +71,68 @@ def create_project(name: str, location: str) -> Path:
     project_path.mkdir(parents=True, exist_ok=False)
     nodes_dir.mkdir(parents=True, exist_ok=False)
     workflow_file = nodes_dir / "example.py"
-    workflow_file.write_text(EXAMPLE_CATEGORY_TEMPLATE, encoding='utf-8')
+    workflow_file.write_bytes(_EXAMPLE_CATEGORY_BYTES)
 
     # Create empty requirements.txt
     requirements_file = project_path / "requirements.txt"
-    requirements_file.write_text("# Add your project dependencies here\n# Example:\n# numpy>=1.21.0\n# pandas>=1.3.0\n", encoding='utf-8')
+    requirements_file.write_bytes(_REQUIREMENTS_BYTES)
 
     # Create empty .layout.json
     layout_file = project_path / ".layout.json"
-    empty_layout = {
-        "version": "1.0",
-        "nodes": {},
-        "connections": []
-    }
-    layout_file.write_text(json.dumps(empty_layout, indent=2), encoding='utf-8')
+    layout_file.write_bytes(_EMPTY_LAYOUT_BYTES)
     
-    print(f"Creating virtual environment for {name}...")
-    venv_manager = VenvManager(str(project_path))
-    if venv_manager.create_venv():
-        print("Virtual environment created successfully")
-    else:
-        print("Failed to create virtual environment")
-        
+    if create_venv:
+        logger.info("Creating virtual environment for %s...", name)
+        venv_manager = VenvManager(str(project_path))
+        if venv_manager.create_venv():
+            logger.info("Virtual environment created successfully")
+        else:
+            logger.warning("Failed to create virtual environment")
 
-    print(f"Created new project: {project_path}")
+    logger.info("Created new project: %s", project_path)
     return project_path
 
 
 def validate_project(path: Path) -> bool:
-    if not path.exists() or not path.is_dir():
-        return False
+    # One directory read classifies nodes/ and .layout.json without a stat per check
+    try:
+        with os.scandir(path) as it:
+            entries = {entry.name: entry for entry in it}
+        nodes_entry = entries.get("nodes")
+        layout_entry = entries.get(".layout.json")
+        if nodes_entry is None or not nodes_entry.is_dir():
+            return False
+        if layout_entry is None or not layout_entry.is_file():
+            return False
 
-    nodes_path = path / "nodes"
-    if not nodes_path.exists() or not nodes_path.is_dir():
+        # Only re-validate when the layout file or nodes folder changed since the last check
+        layout_mtime = layout_entry.stat().st_mtime_ns
+        nodes_mtime = nodes_entry.stat().st_mtime_ns
+    except OSError:
         return False
+    return _validate_project_cached(str(path), layout_mtime, nodes_mtime)
 
-    layout_path = path / ".layout.json"
-    if not layout_path.exists() or not layout_path.is_file():
-        return False
+
+@lru_cache(maxsize=256)
+def _validate_project_cached(path_str: str, layout_mtime: int, nodes_mtime: int) -> bool:
+    path = Path(path_str)
 
     # Validate .layout.json structure
     try:
         layout_file = path / ".layout.json"
-        with open(layout_file, 'r', encoding='utf-8') as f:
-            layout_data = json.load(f)
+        with open(layout_file, 'rb') as f:
+            # Small layouts show both keys up front, no need to parse the whole file
+            head = f.read(_LAYOUT_HEAD_SIZE)
+            if b'"nodes"' in head and b'"connections"' in head:
+                return True
+            raw = head + f.read()
+        layout_data = json_io.loads(raw)
 
         # Check for required keys
         if "nodes" not in layout_data or "connections" not in layout_data:
             return False
 
-    except (json.JSONDecodeError, OSError):
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
         return False
 
     return True
@@ -115,17 +141,17 @@ def initialize_project_venv(project_path: Path) -> VenvManager:
     venv_manager = VenvManager(str(project_path))
 
     if not venv_manager.venv_exists():
-        print(f"Virtual environment not found. Creating one...")
+        logger.info("Virtual environment not found. Creating one...")
         if venv_manager.create_venv():
-            print("Virtual environment created successfully")
+            logger.info("Virtual environment created successfully")
         else:
-            print("Failed to create virtual environment")
+            logger.warning("Failed to create virtual environment")
     else:
         # Validate existing venv
         if venv_manager.validate_venv():
-            print("Virtual environment is ready")
+            logger.info("Virtual environment is ready")
         else:
-            print("Virtual environment exists but may be corrupted")
+            logger.warning("Virtual environment exists but may be corrupted")
     return venv_manager
 
 